@@ -18,6 +18,8 @@ from pvi.device import (
 
 from ._parameters import Record, TypeStrings
 
+ASYN_PARAMETER_NAME_RE = re.compile(r"@asyn\(.*\)(\S+)")
+
 
 class RecordError(Exception):
     pass
@@ -43,12 +45,11 @@ class AsynRecord(Record):
     def get_parameter_name(self) -> str | None:
         # e.g. from: field(INP,  "@asyn($(PORT),$(ADDR=0),$(TIMEOUT=1))FILE_PATH")
         # extract: FILE_PATH
-        parameter_name_extractor = r"@asyn\(.*\)(\S+)"
         parameter_name = None
         for k, v in self.fields.items():
             if k == "INP" or k == "OUT":
                 if "@asyn(" in v:
-                    match = re.search(parameter_name_extractor, v)
+                    match = ASYN_PARAMETER_NAME_RE.search(v)
                     if match:
                         parameter_name = match.group(1)
         return parameter_name
@@ -69,7 +69,7 @@ class Record(BaseModel):
     @cached_property
     def name(self) -> str:
         """Return pv with macros removed to use as label on UIs."""
-        return re.sub(MACRO_RE, "", self.pv)
+        return MACRO_RE.sub("", self.pv)
 
 
 class Parameter(BaseModel):
@@ -1,4 +1,5 @@
 import re
+import sys
 from pathlib import Path
 
 from pvi.device import (
@@ -18,6 +19,16 @@ from ._asyn_convert import (
 )
 from ._parameters import Parameter
 
+RECORD_RE = re.compile(r"\s*^[^#\n]*record\([^{]*{[^}]*}", re.MULTILINE)
+# https://regex101.com/r/MZz1oa
+RECORD_PARTS_RE = re.compile(r'record\((\w+),\s*"?([^"]+)"?\)\s*{([^}]*)}')
+FIELD_RE = re.compile(
+    r'^[^#\n]*(?:field\()([^,]*)(?:,)(?:[^"]*)(?:")([^"]*)(?:")', re.MULTILINE
+)
+INFO_RE = re.compile(
+    r'^[^#\n]*(?:info\()([^,]*)(?:,)(?:[^"]*)(?:")([^"]*)(?:")', re.MULTILINE
+)
+
 OVERRIDE_DESC = "# Overriding value in auto-generated template"
 
 
@@ -66,8 +77,7 @@ class RecordExtractor:
         #    field(NELM, "256")
         #    info(autosaveFields, "VAL")
         # }
-        record_extractor = re.compile(r"\s*^[^#\n]*record\([^{]*{[^}]*}", re.MULTILINE)
-        return re.findall(record_extractor, self._text)
+        return RECORD_RE.findall(self._text)
 
     def _parse_record(self, record_str: str) -> tuple[str, str, str]:
         # extract three groups from a record definition e.g.
@@ -92,9 +102,7 @@ class RecordExtractor:
         #    field(NELM, "256")
         #    info(autosaveFields, "VAL")
 
-        # https://regex101.com/r/MZz1oa
-        record_parser = re.compile(r'record\((\w+),\s*"?([^"]+)"?\)\s*{([^}]*)}')
-        matches = re.findall(record_parser, record_str)
+        matches = RECORD_PARTS_RE.findall(record_str)
         if len(matches) != 1:
             raise RecordError(f"Parse failed on record: {record_str}")
         return matches[0]
@@ -105,10 +113,7 @@ class RecordExtractor:
         # extract:
         # Group 1 - Field: PINI
         # Group 2 - Value: YES
-        field_extractor = re.compile(
-            r'^[^#\n]*(?:field\()([^,]*)(?:,)(?:[^"]*)(?:")([^"]*)(?:")', re.MULTILINE
-        )
-        return re.findall(field_extractor, fields_str)
+        return FIELD_RE.findall(fields_str)
 
     def _extract_infos(self, fields_str: str) -> list[tuple[str, str]]:
         # extract two groups from an info tag e.g.
@@ -116,10 +121,7 @@ class RecordExtractor:
         # extract:
         # Group 1 - Field: autosaveFields
         # Group 2 - Value: VAL
-        info_extractor = re.compile(
-            r'^[^#\n]*(?:info\()([^,]*)(?:,)(?:[^"]*)(?:")([^"]*)(?:")', re.MULTILINE
-        )
-        return re.findall(info_extractor, fields_str)
+        return INFO_RE.findall(fields_str)
 
     def _create_asyn_record(self, record_str: str) -> AsynRecord:
         record_type, record_name, record_fields = self._parse_record(record_str)
@@ -130,8 +132,10 @@ class RecordExtractor:
                 f"Record `{record_str.split(newline)[0]}` is type motor - ignoring"
             )
 
-        fields = dict(self._extract_fields(record_fields))
-        info = dict(self._extract_infos(record_fields))
+        # Field and info names repeat across every record, so intern them to share one
+        # string per name and let the repeated dict lookups compare by identity
+        fields = {sys.intern(k): v for k, v in self._extract_fields(record_fields)}
+        info = {sys.intern(k): v for k, v in self._extract_infos(record_fields)}
         record = AsynRecord(pv=record_name, type=record_type, fields=fields, infos=info)
         return record
 
@@ -242,11 +246,11 @@ class ParameterRoleMatcher:
     def get_actions(
         read_records: list[AsynRecord], write_records: list[AsynRecord]
     ) -> list[Action]:
+        read_names = {r.get_parameter_name() for r in read_records}
         actions = [
             Action(write_record=w)
             for w in write_records
-            if w.get_parameter_name()
-            not in [r.get_parameter_name() for r in read_records]
+            if w.get_parameter_name() not in read_names
         ]
         return actions
 
@@ -254,11 +258,11 @@ class ParameterRoleMatcher:
     def get_readbacks(
         read_records: list[AsynRecord], write_records: list[AsynRecord]
     ) -> list[Readback]:
+        write_names = {w.get_parameter_name() for w in write_records}
         readbacks = [
             Readback(read_record=r)
             for r in read_records
-            if r.get_parameter_name()
-            not in [w.get_parameter_name() for w in write_records]
+            if r.get_parameter_name() not in write_names
         ]
         return readbacks
 
@@ -266,10 +270,13 @@ class ParameterRoleMatcher:
     def get_setting_pairs(
         read_records: list[AsynRecord], write_records: list[AsynRecord]
     ) -> list[SettingPair]:
+        writes_by_name: dict[str | None, list[AsynRecord]] = {}
+        for w in write_records:
+            writes_by_name.setdefault(w.get_parameter_name(), []).append(w)
+
         setting_pairs = [
             SettingPair(read_record=r, write_record=w)
             for r in read_records
-            for w in write_records
-            if r.get_parameter_name() == w.get_parameter_name()
+            for w in writes_by_name.get(r.get_parameter_name(), [])
         ]
         return setting_pairs
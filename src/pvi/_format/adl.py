@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from pvi._format.utils import Bounds, split_with_sep
+from pvi._format.utils import Bounds, split_property_lines, split_with_sep
 from pvi._format.widget import UITemplate, WidgetFormatter
 from pvi.device import TextFormat, TextRead, TextWrite, WidgetUnion
 
@@ -18,6 +18,7 @@ ADL_TEXT_FORMATS = {
 
 class AdlTemplate(UITemplate[str]):
     def __init__(self, text: str):
+        super().__init__()
         assert "children {" not in text, "Can't do groups"
         widgets = split_with_sep(text, "\n}\n")
         self.screen = "".join(widgets[:3])
@@ -38,18 +39,25 @@ class AdlTemplate(UITemplate[str]):
             properties["width"] = bounds.w
             properties["height"] = bounds.h
 
+        template_lines, line_index = split_property_lines(template, "=", lstrip=True)
+        lines = list(template_lines)
+
         for item, value in properties.items():
             if template.startswith('"related display"') and item == "name":
                 if not value.endswith(".adl"):
                     value = f"{value}.adl"  # Must include file extension
 
             # Only need single line
-            pattern = re.compile(rf"^(\s*{item})=.*$", re.MULTILINE)
             if isinstance(value, str):
                 value = f'"{value}"'
 
-            template, n = pattern.subn(r"\g<1>=" + str(value), template)
-            assert n == 1, f"No replacements made for {item}"
+            line_numbers = line_index.get(item, [])
+            assert len(line_numbers) == 1, f"No replacements made for {item}"
+            line = lines[line_numbers[0]]
+            indent = line[: len(line) - len(line.lstrip())]
+            lines[line_numbers[0]] = f"{indent}{item}={value}"
+
+        template = "\n".join(lines)
 
         # Add additional properties from widget
         match widget:
@@ -64,8 +72,9 @@ class AdlTemplate(UITemplate[str]):
 
         return template
 
-    def search(self, search: str) -> str:
-        matches = [t for t in self.widgets if re.search(search, t)]
+    def extract(self, search: str) -> str:
+        pattern = re.compile(search)
+        matches = [t for t in self.widgets if pattern.search(t)]
         assert len(matches) == 1, f"Got {len(matches)} matches for {search!r}"
         return matches[0]
 
@@ -76,15 +85,16 @@ class AdlTemplate(UITemplate[str]):
         padding: Bounds | None = None,
     ) -> list[str]:
         padding = padding or Bounds()
+        dx, dy = padding.x, padding.y
 
-        texts: list[str] = []
-
+        texts = list(group_object)
         for c in children:
-            c.bounds.x += padding.x
-            c.bounds.y += padding.y
-            texts += c.format()
+            bounds = c.bounds
+            bounds.x += dx
+            bounds.y += dy
+            texts.extend(c.format())
 
-        return group_object + texts
+        return texts
 
 
 def is_text_widget(text: str):
@@ -194,7 +194,9 @@ class APSFormatter(Formatter):
             device.children, title
         )
 
-        path.write_text("".join(screen_formatter.format()))
+        with path.open("w") as f:
+            f.writelines(screen_formatter.format())
         for sub_screen_name, sub_screen_formatter in sub_screens:
             sub_screen_path = Path(path.parent / f"{sub_screen_name}{path.suffix}")
-            sub_screen_path.write_text("".join(sub_screen_formatter.format()))
+            with sub_screen_path.open("w") as f:
+                f.writelines(sub_screen_formatter.format())
@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 from typing import Any, Union
 
@@ -18,15 +19,26 @@ class IndexEntry(TypedModel):
     macros: dict[str, str] = Field("Macros to launch UI with")
 
 
+@cache
+def _type_adapter(
+    formatters: tuple[type["Formatter"], ...],
+) -> TypeAdapter["Formatter"]:
+    """Create TypeAdapter of the given Formatter classes
+
+    Building the validator is expensive, so cache it for each set of classes. The key
+    changes if new child classes are defined, so they will still be included.
+
+    """
+    return TypeAdapter(as_tagged_union(Union[formatters]))  # type: ignore # noqa: UP007
+
+
 class Formatter(TypedModel, YamlValidatorMixin):
     """Base UI formatter."""
 
     @classmethod
     def type_adapter(cls) -> TypeAdapter["Formatter"]:
         """Create TypeAdapter of all child classes"""
-        return TypeAdapter(
-            as_tagged_union(Union[tuple(cls.__subclasses__())])  # type: ignore # noqa: UP007
-        )
+        return _type_adapter(tuple(cls.__subclasses__()))
 
     @classmethod
     def from_dict(cls, serialized: dict[str, Any]) -> "Formatter":
@@ -57,6 +69,8 @@ class Formatter(TypedModel, YamlValidatorMixin):
 
         """
         cls.rebuild_child_models()
+        # Rebuilding changes the core schemas, so existing adapters are out of date
+        _type_adapter.cache_clear()
         return cls.type_adapter().json_schema()
 
     def format(self, device: Device, path: Path) -> None:
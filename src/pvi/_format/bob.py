@@ -1,5 +1,6 @@
 from collections.abc import Sequence
 from copy import deepcopy
+from itertools import islice
 from typing import Any
 
 from lxml.etree import (
@@ -38,9 +39,16 @@ class BobTemplate(UITemplate[_Element]):
 
     def __init__(self, text: str):
         """Parse an XML string to an element tree object."""
+        super().__init__()
 
         # Passing `remove_blank_text` means we can pretty print our additions
         self.tree = parse(text, parser=XMLParser(remove_blank_text=True))
+        # 'name' is the unique ID for each element, so index elements by it once
+        self._elements_by_name: dict[str | None, list[_Element]] = {}
+        for element in self.tree.iter("name"):
+            parent = element.getparent()
+            if isinstance(parent, _Element):
+                self._elements_by_name.setdefault(element.text, []).append(parent)
         self.screen = self.search("Display")
 
     def set(
@@ -65,6 +73,12 @@ class BobTemplate(UITemplate[_Element]):
         widget_type = template.attrib.get("type", "")
 
         t_copy = deepcopy(template)
+        # First element of each tag in document order, as `find_element` would find,
+        # so that each property is set without searching the widget again
+        elements: dict[Any, _Element] = {}
+        for element in t_copy.iter():
+            elements.setdefault(element.tag, element)
+
         for item, value in properties.items():
             new_text = ""
 
@@ -83,7 +97,10 @@ class BobTemplate(UITemplate[_Element]):
                     new_text = str(value)
 
             if new_text:
-                find_element(t_copy, item).text = new_text  # type: ignore
+                element = elements.get(item)
+                if element is None:
+                    element = find_element(t_copy, item)
+                element.text = new_text
 
         # Add additional properties from widget
         match widget_type, widget:
@@ -106,7 +123,7 @@ class BobTemplate(UITemplate[_Element]):
 
         return t_copy
 
-    def search(self, search: str) -> _Element:
+    def extract(self, search: str) -> _Element:
         """Locate and extract elements from the Element tree.
 
         Args:
@@ -117,26 +134,19 @@ class BobTemplate(UITemplate[_Element]):
             The extracted element.
         """
 
-        tree_copy = deepcopy(self.tree)
-        # 'name' is the unique ID for each element
-        matches = [
-            e
-            for e in [
-                element.getparent()
-                for element in tree_copy.iter("name")
-                if element.text == search
-            ]
-            if isinstance(e, _Element)
-        ]
+        matches = self._elements_by_name.get(search, [])
         assert len(matches) == 1, f"Got {len(matches)} matches for {search!r}"
 
+        # Copy only the matched element, leaving the template tree untouched
+        match = deepcopy(matches[0])
+
         # Isolate the screen properties
-        if matches[0].tag == "display":
-            for child in matches[0]:
+        if match.tag == "display":
+            for child in match:
                 if child.tag == "widget":
-                    matches[0].remove(child)
+                    match.remove(child)
 
-        return matches[0]
+        return match
 
     def create_group(
         self,
@@ -160,8 +170,7 @@ class BobTemplate(UITemplate[_Element]):
         assert (
             len(group_object) == 1
         ), f"Size of group_object is {len(group_object)}, should be 1"
-        for c in children:
-            group_object[0].append(c.format()[0])
+        group_object[0].extend([c.format()[0] for c in children])
         return group_object
 
 
@@ -245,8 +254,9 @@ def find_element(root_element: _Element, tag: str, index: int = 0) -> _Element:
         tag: Tag to search for in tree
         index: Match to return if multiple matches are found
     """
-    match list(root_element.iter(tag=tag)):
-        case []:
-            raise ValueError(f"No matches for '{tag}' in {root_element}")
-        case matches:
-            return matches[index]
+    # Stop iterating at the requested match
+    element = next(islice(root_element.iter(tag=tag), index, None), None)
+    if element is None:
+        raise ValueError(f"No matches for '{tag}' in {root_element}")
+
+    return element
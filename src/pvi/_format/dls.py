@@ -218,10 +218,12 @@ class DLSFormatter(Formatter):
             device.children, title
         )
 
-        path.write_text("".join(screen_formatter.format()))
+        with path.open("w") as f:
+            f.writelines(screen_formatter.format())
         for sub_screen_name, sub_screen_formatter in sub_screens:
             sub_screen_path = Path(path.parent / f"{sub_screen_name}{path.suffix}")
-            sub_screen_path.write_text("".join(sub_screen_formatter.format()))
+            with sub_screen_path.open("w") as f:
+                f.writelines(sub_screen_formatter.format())
 
     def format_bob(self, device: Device, path: Path):
         template = BobTemplate(str(Path(__file__).parent / "dls.bob"))
@@ -406,12 +408,13 @@ def write_bob(screen_formatter: GroupFormatter[_Element], path: Path):
     # The root:'Display' is always the first element in texts
     texts = screen_formatter.format()
     element_tree = fromstring(tostring(texts[0]), None)
-    for element in texts[:0:-1]:
-        grid_step_y = element_tree.find("grid_step_y")
-        if grid_step_y is None:
-            raise ValueError(f"Could not find grid_step_y in element {element}")
+    grid_step_y = element_tree.find("grid_step_y")
+    if grid_step_y is None:
+        raise ValueError(f"Could not find grid_step_y in element {element_tree}")
 
-        element_tree.insert(element_tree.index(grid_step_y) + 1, element)
+    # Insert all the widgets, in order, directly after grid_step_y in one go
+    insert_index = element_tree.index(grid_step_y) + 1
+    element_tree[insert_index:insert_index] = texts[1:]
 
     element_tree = element_tree.getroottree()
     find_element(element_tree, "name").text = screen_formatter.title  # type: ignore
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import re
+from functools import cache
 from typing import Any
 
-from pvi._format.utils import Bounds, split_with_sep
+from pvi._format.utils import (
+    Bounds,
+    index_property_lines,
+    split_property_lines,
+    split_with_sep,
+)
 from pvi._format.widget import UITemplate, WidgetFormatter
 from pvi.device import TextFormat, TextRead, TextWrite, WidgetUnion
 
@@ -18,6 +24,7 @@ EDL_TEXT_FORMATS = {
 
 class EdlTemplate(UITemplate[str]):
     def __init__(self, text: str):
+        super().__init__()
         assert "endGroup" not in text, "Can't do groups"
         self.screen, text = split_with_sep(text, "\nendScreenProperties\n", 1)
         self.widgets = split_with_sep(text, "\nendObjectProperties\n")
@@ -34,23 +41,36 @@ class EdlTemplate(UITemplate[str]):
         if bounds:
             for k in "xywh":
                 properties[k] = getattr(bounds, k)
+
+        template_lines, line_index = split_property_lines(template, " ")
+        lines = list(template_lines)
+
         for item, value in properties.items():
             if item == "displayFileName":
                 value = f"0 {value}"  # These are items in an array but we only use one
 
-            multiline = re.compile(rf"^{item} {{[^}}]*}}$", re.MULTILINE | re.DOTALL)
-            if multiline.search(template):
-                pattern = multiline
-                lines = str(value).splitlines()
-                value = "\n".join(["{"] + [f'  "{x}"' for x in lines] + ["}"])
-            else:
-                # Single line
-                pattern = re.compile(rf"^{item} .*$", re.MULTILINE)
-                if isinstance(value, str):
-                    value = f'"{value}"'
-
-            template, n = pattern.subn(f"{item} {value}", template)
-            assert n == 1, f"No replacements made for {item}"
+            line_numbers = line_index.get(item, [])
+            if any(lines[i].startswith(f"{item} {{") for i in line_numbers):
+                # `{ ... }` block properties span lines, so replace them in the text
+                multiline = multiline_property_pattern(item)
+                template = "\n".join(lines)
+                if m := multiline.search(template):
+                    value_lines = str(value).splitlines()
+                    value = "\n".join(["{"] + [f'  "{x}"' for x in value_lines] + ["}"])
+                    template = (
+                        template[: m.start()] + f"{item} {value}" + template[m.end() :]
+                    )
+                    lines = template.split("\n")
+                    line_index = index_property_lines(lines, " ")
+                    continue
+
+            # Single line
+            if isinstance(value, str):
+                value = f'"{value}"'
+            assert len(line_numbers) == 1, f"No replacements made for {item}"
+            lines[line_numbers[0]] = f"{item} {value}"
+
+        template = "\n".join(lines)
 
         # Add additional properties from widget
         match widget:
@@ -65,8 +85,9 @@ class EdlTemplate(UITemplate[str]):
 
         return template
 
-    def search(self, search: str) -> str:
-        matches = [t for t in self.widgets if re.search(search, t)]
+    def extract(self, search: str) -> str:
+        pattern = re.compile(search)
+        matches = [t for t in self.widgets if pattern.search(t)]
         assert len(matches) == 1, f"Got {len(matches)} matches for {search!r}"
         return matches[0]
 
@@ -77,15 +98,16 @@ class EdlTemplate(UITemplate[str]):
         padding: Bounds | None = None,
     ) -> list[str]:
         padding = padding or Bounds()
+        dx, dy = padding.x, padding.y
 
-        texts: list[str] = []
-
+        texts = list(group_object)
         for c in children:
-            c.bounds.x += padding.x
-            c.bounds.y += padding.y
-            texts += c.format()
+            bounds = c.bounds
+            bounds.x += dx
+            bounds.y += dy
+            texts.extend(c.format())
 
-        return group_object + texts
+        return texts
 
 
 def is_text_widget(text: str):
@@ -95,3 +117,9 @@ def is_text_widget(text: str):
 def add_property(text: str, property: str, value: str) -> str:
     end = "endObjectProperties\n"
     return text.replace(end, f'{property} "{value}"\n{end}')
+
+
+@cache
+def multiline_property_pattern(item: str) -> re.Pattern[str]:
+    """Compile (once per item) a pattern matching a `{ ... }` block property"""
+    return re.compile(rf"^{re.escape(item)} {{[^}}]*}}$", re.MULTILINE | re.DOTALL)
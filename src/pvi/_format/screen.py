@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator, Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import (
     Generic,
     TypeVar,
@@ -15,7 +15,7 @@ from pvi._format.widget import (
     WidgetFormatterFactory,
     max_x,
     max_y,
-    next_x,
+    next_position,
     next_y,
 )
 from pvi.device import (
@@ -40,7 +40,7 @@ from pvi.device import (
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenLayout:
     spacing: int
     title_height: int
@@ -53,7 +53,7 @@ class ScreenLayout:
     group_width_offset: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenFormatterFactory(Generic[T]):
     screen_formatter_cls: type[GroupFormatter[T]]
     group_formatter_cls: type[GroupFormatter[T]]
@@ -93,45 +93,46 @@ class ScreenFormatterFactory(Generic[T]):
             case _:
                 pass
 
+        # Running extents of screen_widgets, to avoid rescanning it per component
+        screen_max_x = screen_max_y = 0
         for c in components:
             last_column_bounds = columns[-1]
             next_column_bounds = Bounds(
-                x=next_x(screen_widgets, self.layout.spacing),
+                x=next_position(screen_widgets, screen_max_x, self.layout.spacing),
                 y=0,
                 **widget_dims,
             )
             if isinstance(c, Group) and not isinstance(c.layout, Row):
                 # Create embedded group widget containing its components
                 # Note: Group adjusts bounds to fit the components
-                screen_widgets.extend(
-                    self.create_group_formatters(
-                        c,
-                        screen_bounds=screen_bounds,
-                        column_bounds=last_column_bounds,
-                        next_column_bounds=next_column_bounds,
-                    )
+                widgets = self.create_group_formatters(
+                    c,
+                    screen_bounds=screen_bounds,
+                    column_bounds=last_column_bounds,
+                    next_column_bounds=next_column_bounds,
                 )
             else:
                 # Create top level single line widget or Row of widgets
                 # Note: This will change columns in place
-                screen_widgets.extend(
-                    self.create_component_widget_formatters(
-                        c,
-                        parent_bounds=screen_bounds,
-                        column_bounds=last_column_bounds,
-                        next_column_bounds=next_column_bounds,
-                        # Indent top-level widgets to align with Group widgets
-                        indent=True,
-                    )
+                widgets = self.create_component_widget_formatters(
+                    c,
+                    parent_bounds=screen_bounds,
+                    column_bounds=last_column_bounds,
+                    next_column_bounds=next_column_bounds,
+                    # Indent top-level widgets to align with Group widgets
+                    indent=True,
                 )
+            screen_widgets.extend(widgets)
+            screen_max_x = max(screen_max_x, max_x(widgets))
+            screen_max_y = max(screen_max_y, max_y(widgets))
 
             if next_column_bounds.y != 0:
                 columns.append(next_column_bounds)
 
         sub_screens = self.create_sub_screen_formatters(screen_widgets)
 
-        screen_bounds.w = max_x(screen_widgets)
-        screen_bounds.h = max_y(screen_widgets)
+        screen_bounds.w = screen_max_x
+        screen_bounds.h = screen_max_y
         return (
             self.screen_formatter_cls(
                 bounds=screen_bounds, title=title, children=screen_widgets
@@ -162,19 +163,22 @@ class ScreenFormatterFactory(Generic[T]):
             List of (file name, `ScreenFormatter`) created from `SubScreenFactory`s
 
         """
-        sub_screen_widget_formatters = [
-            # At the root
-            widget_factory
-            for widget_factory in screen_widgets
-            if isinstance(widget_factory, SubScreenWidgetFormatter)
-        ] + [
-            # Nested in a Group
-            group_widget_factory
-            for widget_factory in screen_widgets
-            if isinstance(widget_factory, GroupFormatter)
-            for group_widget_factory in widget_factory.children
-            if isinstance(group_widget_factory, SubScreenWidgetFormatter)
-        ]
+        # Collect those at the root and those nested in a Group in one pass, keeping
+        # root formatters first
+        root_sub_screen_widget_formatters: list[SubScreenWidgetFormatter[T]] = []
+        nested_sub_screen_widget_formatters: list[SubScreenWidgetFormatter[T]] = []
+        for widget_factory in screen_widgets:
+            if isinstance(widget_factory, SubScreenWidgetFormatter):
+                root_sub_screen_widget_formatters.append(widget_factory)
+            elif isinstance(widget_factory, GroupFormatter):
+                nested_sub_screen_widget_formatters.extend(
+                    group_widget_factory
+                    for group_widget_factory in widget_factory.children
+                    if isinstance(group_widget_factory, SubScreenWidgetFormatter)
+                )
+        sub_screen_widget_formatters = (
+            root_sub_screen_widget_formatters + nested_sub_screen_widget_formatters
+        )
 
         sub_screen_formatters: list[tuple[str, GroupFormatter[T]]] = []
         for sub_screen_widget_formatter in sub_screen_widget_formatters:
@@ -257,13 +261,10 @@ class ScreenFormatterFactory(Generic[T]):
                 + self.layout.spacing
             )
         else:
-            # Won't fit in first column, recreate in next column
-            group_formatter = self.create_group_formatter(
-                c,
-                bounds=Bounds(
-                    x=next_column_bounds.x, y=next_column_bounds.y, h=screen_bounds.h
-                ),
-            )
+            # Won't fit in first column, move to next column. The children are laid out
+            # relative to the group, so only the group position needs to change.
+            group_formatter.bounds.x = next_column_bounds.x
+            group_formatter.bounds.y = next_column_bounds.y
             group_formatter.bounds.w += self.layout.group_width_offset
 
             next_column_bounds.y = (
@@ -296,6 +297,8 @@ class ScreenFormatterFactory(Generic[T]):
             group.layout, Grid | SubScreen
         ), "Can only do Grid and SubScreen at the moment"
 
+        # Running extents of widget_factories, to avoid rescanning it per component
+        group_max_x = group_max_y = 0
         for c in group.children:
             component: Group | Component
             match c:
@@ -314,25 +317,26 @@ class ScreenFormatterFactory(Generic[T]):
                     component = c
 
             next_column_bounds = Bounds(
-                x=next_x(widget_factories, self.layout.spacing),
+                x=next_position(widget_factories, group_max_x, self.layout.spacing),
                 w=full_w,
                 h=self.layout.widget_height,
             )
-            widget_factories.extend(
-                self.create_component_widget_formatters(
-                    component,
-                    parent_bounds=bounds,
-                    column_bounds=column_bounds,
-                    next_column_bounds=next_column_bounds,
-                    add_label=group.layout.labelled,
-                )
+            widgets = self.create_component_widget_formatters(
+                component,
+                parent_bounds=bounds,
+                column_bounds=column_bounds,
+                next_column_bounds=next_column_bounds,
+                add_label=group.layout.labelled,
             )
+            widget_factories.extend(widgets)
+            group_max_x = max(group_max_x, max_x(widgets))
+            group_max_y = max(group_max_y, max_y(widgets))
             if next_column_bounds.y != 0:
                 # We have moved onto the next column
                 column_bounds = next_column_bounds
 
-        bounds.h = max_y(widget_factories)
-        bounds.w = max_x(widget_factories)
+        bounds.h = group_max_y
+        bounds.w = group_max_x
         return self.group_formatter_cls(
             bounds=bounds, title=group.get_label(), children=widget_factories
         )
@@ -367,29 +371,42 @@ class ScreenFormatterFactory(Generic[T]):
             added widget
 
         """
-        # Take copies so we don't modify the originals until we're done
-        tmp_column_bounds = column_bounds.clone()
-        tmp_next_column_bounds = next_column_bounds.clone()
-
-        if indent:
-            tmp_column_bounds.indent(self.layout.group_widget_indent)
-            tmp_next_column_bounds.indent(self.layout.group_widget_indent)
-
-        widgets = list(
-            self.generate_component_formatters(c, tmp_column_bounds, add_label)
-        )
-        if max_y(widgets) <= parent_bounds.h:
+        # generate_component_formatters works on its own copy of the bounds it is
+        # given, so the originals are only modified below, once we're done. The next
+        # column bounds are only needed if the current column overflows.
+        bounds = self.component_bounds(column_bounds, indent)
+        widgets = list(self.generate_component_formatters(c, bounds, add_label))
+        widgets_max_y = max_y(widgets)
+        if widgets_max_y <= parent_bounds.h:
             # Current column still fits on screen
-            column_bounds.y = next_y(widgets, self.layout.spacing)
+            column_bounds.y = next_position(widgets, widgets_max_y, self.layout.spacing)
         else:
-            # Widget makes current column too tall. Repeat in next column.
-            widgets = list(
-                self.generate_component_formatters(c, tmp_next_column_bounds, add_label)
-            )
+            # Widget makes current column too tall. Move it to the next column.
+            next_bounds = self.component_bounds(next_column_bounds, indent)
+            # The layout only depends on the size of the bounds, so shift the widgets
+            assert (next_bounds.w, next_bounds.h) == (bounds.w, bounds.h)
+            dx, dy = next_bounds.x - bounds.x, next_bounds.y - bounds.y
+            for widget in widgets:
+                widget.bounds.x += dx
+                widget.bounds.y += dy
             next_column_bounds.y = next_y(widgets, self.layout.spacing)
 
         return widgets
 
+    def component_bounds(self, column_bounds: Bounds, indent: bool) -> Bounds:
+        """Return the bounds to lay out a component from in the given column
+
+        Args:
+            column_bounds: Bounds of widget in the column
+            indent: Shift to the group indent level
+
+        """
+        indentation = self.layout.group_widget_indent if indent else 0
+        if not indentation:
+            return column_bounds
+
+        return replace(column_bounds, x=column_bounds.x + indentation)
+
     def generate_component_formatters(
         self,
         c: ComponentUnion,
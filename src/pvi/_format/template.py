@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 from jinja2 import Template
@@ -15,13 +16,19 @@ from pvi.device import (
 PVI_TEMPLATE = Path(__file__).parent / "pvi.template.jinja"
 
 
-@dataclass
+@dataclass(slots=True)
 class PviRecord:
     name: str
     pv: str
     access: str
 
 
+@cache
+def _pvi_template() -> Template:
+    """Compile the PVI record template once and reuse it for every device."""
+    return Template(PVI_TEMPLATE.read_text())
+
+
 def format_template(device: Device, pv_prefix: str, output: Path):
     records: list[PviRecord] = []
     for node in walk(device.children):
@@ -40,8 +47,10 @@ def format_template(device: Device, pv_prefix: str, output: Path):
             case _:
                 pass
 
-    with output.open("w") as expanded, open(PVI_TEMPLATE) as template:
-        template_txt = Template(template.read()).render(
+    with output.open("w") as expanded:
+        # Stream the rendered template straight into the file to avoid building the
+        # whole output in memory
+        _pvi_template().stream(
             device=device.label, pv_prefix=pv_prefix, records=records
-        )
-        expanded.write(template_txt + "\n")
+        ).dump(expanded)  # type: ignore
+        expanded.write("\n")
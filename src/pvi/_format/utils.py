@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import cache
+from itertools import accumulate, chain
 from typing import TypeVar
 
-from pydantic import BaseModel
 
-
-class Bounds(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Bounds:
     x: int = 0
     y: int = 0
     w: int = 0
@@ -31,7 +33,10 @@ class Bounds(BaseModel):
         widget_space = self.w - splits * spacing
         widget_widths = tuple(int(widget_space * r) for r in ratio)
         widget_xs = tuple(
-            self.x + sum(widget_widths[:i]) + spacing * i for i in range(splits + 1)
+            self.x + preceding_width + spacing * i
+            for i, preceding_width in enumerate(
+                accumulate(widget_widths[:-1], initial=0)
+            )
         )
 
         return tuple(
@@ -80,11 +85,64 @@ T = TypeVar("T")
 
 
 def concat(items: list[list[T]]) -> list[T]:
-    return [x for seq in items for x in seq]
+    return list(chain.from_iterable(items))
 
 
 def split_with_sep(text: str, sep: str, maxsplit: int = -1) -> list[str]:
-    return [t + sep for t in text.split(sep, maxsplit=maxsplit)]
+    """Split text on sep, keeping sep on the end of each piece it terminated.
+
+    The remainder after the last sep is kept as-is, or dropped if empty.
+    """
+    if not sep:
+        raise ValueError("empty separator")
+
+    pieces: list[str] = []
+    start = 0
+    while maxsplit < 0 or len(pieces) < maxsplit:
+        end = text.find(sep, start)
+        if end == -1:
+            break
+        end += len(sep)
+        pieces.append(text[start:end])
+        start = end
+
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+
+def index_property_lines(
+    lines: Sequence[str], sep: str, lstrip: bool = False
+) -> dict[str, list[int]]:
+    """Map each property name to the numbers of the lines that set it
+
+    Args:
+        lines: Lines of a template
+        sep: Separator between a property name and its value
+        lstrip: Whether property lines may be indented
+
+    """
+    line_index: dict[str, list[int]] = {}
+    for i, line in enumerate(lines):
+        if lstrip:
+            line = line.lstrip()
+        item, found_sep, _ = line.partition(sep)
+        if found_sep:
+            line_index.setdefault(item, []).append(i)
+    return line_index
+
+
+@cache
+def split_property_lines(
+    text: str, sep: str, lstrip: bool = False
+) -> tuple[tuple[str, ...], dict[str, list[int]]]:
+    """Split template text into lines and index them with `index_property_lines`
+
+    Cached by text, as each template snippet is set once per widget formatted from it.
+    The index is shared, so it must not be modified.
+    """
+    lines = tuple(text.split("\n"))
+    return lines, index_property_lines(lines, sep, lstrip)
 
 
 def with_title(spacing: int, title_height: int) -> Callable[[Bounds], Bounds]:
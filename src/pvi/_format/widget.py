@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any, Generic, TypeVar
 
 from typing_extensions import Self
@@ -38,8 +38,29 @@ T = TypeVar("T")
 class UITemplate(Generic[T]):
     screen: T
 
+    def __init__(self) -> None:
+        # Search results by search expression - `set` copies what it modifies, so these
+        # can be shared between every widget formatted from them
+        self._search_results: dict[str, T] = {}
+
     def search(self, search: str) -> T:
-        """Extract a snippet from the template
+        """Extract a snippet from the template, reusing the result of a previous search
+
+        Args:
+            search: The search expression
+                This must be unique in the template so that there is only one match
+
+        Returns:
+            The snippet matching the search
+
+        """
+        if search not in self._search_results:
+            self._search_results[search] = self.extract(search)
+
+        return self._search_results[search]
+
+    def extract(self, search: str) -> T:
+        """Find and extract a snippet from the template
 
         Args:
             search: The search expression
@@ -84,7 +105,7 @@ class UITemplate(Generic[T]):
         raise NotImplementedError(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetFormatter(Generic[T]):
     bounds: Bounds
 
@@ -141,23 +162,23 @@ class WidgetFormatter(Generic[T]):
         return type(  # type: ignore
             f"""{cls.__name__}<{search.strip('"')}>""",
             (cls,),
-            {"format": format},
+            {"format": format, "__slots__": ()},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelWidgetFormatter(WidgetFormatter[T]):
     text: str
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PVWidgetFormatter(WidgetFormatter[T]):
     pv: str
     widget: WidgetUnion
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionWidgetFormatter(WidgetFormatter[T]):
     label: str
     pv: str
@@ -168,7 +189,7 @@ class ActionWidgetFormatter(WidgetFormatter[T]):
         return f"{self.pv} = {self.value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubScreenWidgetFormatter(WidgetFormatter[T]):
     label: str
     file_name: str
@@ -188,7 +209,7 @@ else:
         SCREEN = "SCREEN"
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupFormatter(WidgetFormatter[T]):
     bounds: Bounds
     title: str
@@ -251,40 +272,43 @@ class GroupFormatter(WidgetFormatter[T]):
                 # Make screen title
                 if widget_formatter_hook:
                     for widget in widget_formatter_hook(self.bounds, self.title):
-                        texts += widget.format()
+                        texts.extend(widget.format())
+                dx, dy = padding.x, padding.y
                 for c in self.children:
-                    c.bounds.x += padding.x
-                    c.bounds.y += padding.y
-                    texts += c.format()
+                    bounds = c.bounds
+                    bounds.x += dx
+                    bounds.y += dy
+                    texts.extend(c.format())
 
             if search == GroupType.GROUP:
                 # Make group object
                 if widget_formatter_hook:
                     for widget in widget_formatter_hook(self.bounds, self.title):
-                        made_widgets += widget.format()
-                texts += template.create_group(made_widgets, self.children, padding)
+                        made_widgets.extend(widget.format())
+                texts.extend(
+                    template.create_group(made_widgets, self.children, padding)
+                )
             return texts
 
         def resize(self: GroupFormatter[T]):
             """Resize based on widget template.
 
-            Called in __init__ by parent class.
+            Called in __init__ by parent class. The bounds are resized in place, so
+            each group should be given its own `Bounds`.
 
             """
             padding = sized(self.bounds)
-            self.bounds = Bounds(
-                x=self.bounds.x, y=self.bounds.y, w=padding.w, h=padding.h
-            )
-            pass
+            self.bounds.w = padding.w
+            self.bounds.h = padding.h
 
         return type(  # type: ignore
             f"{cls.__name__}<{search}>",
             (cls,),
-            {"format": format, "resize": resize},
+            {"format": format, "resize": resize, "__slots__": ()},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetFormatterFactory(Generic[T]):
     header_formatter_cls: type[LabelWidgetFormatter[T]]
     label_formatter_cls: type[LabelWidgetFormatter[T]]
@@ -302,6 +326,27 @@ class WidgetFormatterFactory(Generic[T]):
     array_trace_formatter_cls: type[PVWidgetFormatter[T]]
     button_panel_formatter_cls: type[PVWidgetFormatter[T]]
     image_read_formatter_cls: type[PVWidgetFormatter[T]]
+    _widget_formatter_classes: dict[type, type[PVWidgetFormatter[T]]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._widget_formatter_classes = {
+            # Currently supported formatters of ReadWidget/WriteWidget Components
+            LED: self.led_formatter_cls,
+            ProgressBar: self.progress_bar_formatter_cls,
+            TextRead: self.text_read_formatter_cls,
+            TableRead: self.table_formatter_cls,
+            CheckBox: self.check_box_formatter_cls,
+            ToggleButton: self.toggle_formatter_cls,
+            ComboBox: self.combo_box_formatter_cls,
+            TextWrite: self.text_write_formatter_cls,
+            TableWrite: self.table_formatter_cls,
+            BitField: self.bitfield_formatter_cls,
+            ArrayTrace: self.array_trace_formatter_cls,
+            ButtonPanel: self.button_panel_formatter_cls,
+            ImageRead: self.image_read_formatter_cls,
+        }
 
     def pv_widget_formatter(
         self,
@@ -319,51 +364,33 @@ class WidgetFormatterFactory(Generic[T]):
         Returns:
             A WidgetFormatter representing the component
         """
-
-        widget_formatter_classes: dict[type, type[PVWidgetFormatter[T]]] = {
-            # Currently supported formatters of ReadWidget/WriteWidget Components
-            LED: self.led_formatter_cls,
-            ProgressBar: self.progress_bar_formatter_cls,
-            TextRead: self.text_read_formatter_cls,
-            TableRead: self.table_formatter_cls,
-            CheckBox: self.check_box_formatter_cls,
-            ToggleButton: self.toggle_formatter_cls,
-            ComboBox: self.combo_box_formatter_cls,
-            TextWrite: self.text_write_formatter_cls,
-            TableWrite: self.table_formatter_cls,
-            BitField: self.bitfield_formatter_cls,
-            ArrayTrace: self.array_trace_formatter_cls,
-            ButtonPanel: self.button_panel_formatter_cls,
-            ImageRead: self.image_read_formatter_cls,
-        }
         if isinstance(widget, TextRead | TextWrite):
-            bounds.h *= widget.get_lines()
+            lines = widget.get_lines()
+            if lines != 1:
+                # Don't modify caller's bounds
+                bounds = replace(bounds, h=bounds.h * lines)
 
-        widget_formatter_cls = widget_formatter_classes[type(widget)]
+        widget_formatter_cls = self._widget_formatter_classes[type(widget)]
         return widget_formatter_cls(bounds=bounds, pv=pv, widget=widget)
 
 
 def max_x(widgets: list[WidgetFormatter[T]]) -> int:
     """Given multiple widgets, calulate the maximum x position that they occupy"""
-    if widgets:
-        return max(w.bounds.x + w.bounds.w for w in widgets)
-    else:
-        return 0
+    return max((w.bounds.x + w.bounds.w for w in widgets), default=0)
 
 
 def max_y(widgets: list[WidgetFormatter[T]]) -> int:
     """Given multiple widgets, calulate the maximum y position that they occupy"""
-    if widgets:
-        return max(w.bounds.y + w.bounds.h for w in widgets)
-    else:
-        return 0
+    return max((w.bounds.y + w.bounds.h for w in widgets), default=0)
 
 
-def next_x(widgets: list[WidgetFormatter[T]], spacing: int = 0) -> int:
-    """Given multiple widgets, calulate the next feasible location for an
-    additional widget in the x axis"""
+def next_position(
+    widgets: list[WidgetFormatter[T]], extent: int, spacing: int = 0
+) -> int:
+    """Given multiple widgets and the maximum position that they occupy on an axis,
+    calulate the next feasible location for an additional widget on that axis"""
     if widgets:
-        return max_x(widgets) + spacing
+        return extent + spacing
     else:
         return 0
 
@@ -371,7 +398,4 @@ def next_x(widgets: list[WidgetFormatter[T]], spacing: int = 0) -> int:
 def next_y(widgets: list[WidgetFormatter[T]], spacing: int = 0) -> int:
     """Given multiple widgets, calulate the next feasible location for an
     additional widget in the y axis"""
-    if widgets:
-        return max_y(widgets) + spacing
-    else:
-        return 0
+    return next_position(widgets, max_y(widgets), spacing)
@@ -11,6 +11,8 @@ from pvi.device import (
     walk,
 )
 
+Y_COORDINATE_RE = re.compile(r"\d+")
+
 
 def find_pvs(pvs: list[str], file_path: Path) -> tuple[list[str], list[str]]:
     """Search for the PVs in the file and return lists of found and not found pvs"""
@@ -24,26 +26,15 @@ def find_pvs(pvs: list[str], file_path: Path) -> tuple[list[str], list[str]]:
         if pv not in file_content:
             continue
 
-        # This regex searches for the first y coordinate before the given PV
-        # https://regex101.com/r/41yX56/1
-        widget_regex = re.compile(
-            "".join(
-                (
-                    # The y-coordinate in a match group named `y`
-                    r"y=(?P<y>\d+)",
-                    # Negative lookahead asserting no further y-coordinate before PV
-                    r"(?!.*y=.*" + pv + r")",
-                    # Any characters and then PV
-                    r".*" + pv,
-                )
-            ),
-            re.MULTILINE | re.DOTALL,
+        # Find the last y coordinate before the last occurrence of the PV
+        y_index = file_content.rfind("y=", 0, file_content.rfind(pv))
+        match = (
+            Y_COORDINATE_RE.match(file_content, y_index + 2) if y_index >= 0 else None
         )
-        match = re.search(widget_regex, file_content)
 
         assert match, f"{pv} found in {file_path.name} but did not match a y coordinate"
 
-        y = int(match["y"])
+        y = int(match[0])
         if y in pv_coordinates:
             pv_coordinates[y].append(pv)
         else:
@@ -1,4 +1,6 @@
 import re
+from collections import OrderedDict
+from copy import deepcopy
 from pathlib import Path
 from typing import Any, TypeVar, overload
 
@@ -9,6 +11,20 @@ Leaf = dict[str, Any] | list[Any]
 Branch = dict[str, "Branch | Any"] | list["Branch | Any"]
 Tree = Branch | Leaf
 
+TYPE_LINE_RE = re.compile(r"(\s*- type:)")
+
+# Maximum number of parsed YAML files to keep in the `load_yaml` cache
+YAML_CACHE_SIZE = 100
+
+# Serialized data is plain dicts and lists with no comments or anchors to round-trip,
+# so use the safe loader/dumper, which is backed by libyaml when it is available
+_SAFE_YAML = YAML(typ="safe")
+# Match the block style and insertion ordering of the default round-trip dumper
+_SAFE_YAML.default_flow_style = False
+_SAFE_YAML.sort_base_mapping_type_on_output = False  # type: ignore
+# Parsed YAML by path, with the (mtime, size) of the file when it was parsed
+_yaml_cache: OrderedDict[Path, tuple[tuple[int, int], dict[str, Any]]] = OrderedDict()
+
 
 @overload
 def type_first(tree: dict[str, T]) -> dict[str, T]: ...
@@ -49,7 +65,7 @@ def type_first(tree: Tree) -> Tree:
 
 
 def add_line_before_type(s: str) -> str:
-    return re.sub(r"(\s*- type:)", "\n\\g<1>", s)
+    return TYPE_LINE_RE.sub("\n\\g<1>", s)
 
 
 def dump_yaml(serialized: dict[str, Any], path: Path) -> None:
@@ -61,12 +77,31 @@ def dump_yaml(serialized: dict[str, Any], path: Path) -> None:
     Add a space in between each entry for readability.
 
     """
-    YAML().dump(serialized, path, transform=add_line_before_type)  # type: ignore
+    _SAFE_YAML.dump(serialized, path, transform=add_line_before_type)  # type: ignore
 
 
 def load_yaml(path: Path) -> dict[str, Any]:
-    """Load yaml from file."""
-    return YAML(typ="safe").load(path)  # type: ignore
+    """Load yaml from file.
+
+    Parsed files are cached and only re-read if the modification time or size of the
+    file changes. A copy is returned, so the caller is free to modify it.
+
+    """
+    path = path.absolute()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == key:
+        _yaml_cache.move_to_end(path)
+        return deepcopy(cached[1])
+
+    data: dict[str, Any] = _SAFE_YAML.load(path)  # type: ignore
+    _yaml_cache[path] = (key, data)
+    if len(_yaml_cache) > YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+
+    return deepcopy(data)
 
 
 class YamlValidatorMixin:
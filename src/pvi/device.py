@@ -4,6 +4,7 @@ import json
 import re
 from collections.abc import Iterator, Sequence
 from enum import Enum
+from functools import cache
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -29,6 +30,7 @@ PASCAL_CASE_REGEX = re.compile(r"(?<![A-Z])[A-Z]|[A-Z][a-z/d]|(?<=[a-z])\d")
 NON_PASCAL_CHARS_RE = re.compile(r"[^A-Za-z0-9]")
 
 
+@cache
 def to_title_case(pascal_s: str) -> str:
     """Takes a PascalCaseFieldName and returns an Title Case Field Name
 
@@ -86,15 +88,11 @@ class TextFormat(Enum):
 
 
 class AccessModeMixin(BaseModel):
-    _access_mode: ClassVar[str]
-
-    @property
-    def access_mode(self) -> str:
-        return self._access_mode
+    access_mode: ClassVar[str]
 
 
 class ReadWidget(TypedModel, AccessModeMixin):
-    _access_mode = "r"
+    access_mode = "r"
 
 
 class LED(ReadWidget):
@@ -145,7 +143,7 @@ class ImageRead(ReadWidget):
 class WriteWidget(TypedModel, AccessModeMixin):
     """Widget that controls a PV"""
 
-    _access_mode = "w"
+    access_mode = "w"
 
 
 class CheckBox(WriteWidget):
@@ -311,7 +309,7 @@ class Signal(Component, AccessModeMixin):
 class SignalR(Signal):
     """Read-only `Signal` backed by a single PV."""
 
-    _access_mode = "r"
+    access_mode = "r"
 
     read_pv: str = Field(description="PV to use for readback")
     read_widget: Annotated[
@@ -326,7 +324,7 @@ class SignalR(Signal):
 class SignalW(Signal):
     """Write-only `Signal` backed by a single PV."""
 
-    _access_mode = "w"
+    access_mode = "w"
 
     write_pv: str = Field(description="PV to use for demand")
     write_widget: Annotated[
@@ -344,7 +342,7 @@ class SignalRW(SignalR, SignalW):
     If `read_pv` is set and `read_widget` is not, a `TextRead` widget will be used.
     """
 
-    _access_mode = "rw"
+    access_mode = "rw"
     # Flag to show this is a single PV SignalRW and the `read_pv` has been dynamically
     # set to `write_pv`. This ensures that `_validate_model` is idempotent.
     _single_pv_rw = False
@@ -431,9 +429,11 @@ Tree = Sequence[ComponentUnion]
 
 def walk(tree: Tree) -> Iterator[ComponentUnion]:
     """Depth first traversal of tree"""
-    for t in tree:
+    stack = list(reversed(tree))
+    while stack:
+        t = stack.pop()
         if isinstance(t, Group):
-            yield from walk(t.children)
+            stack.extend(reversed(t.children))
         else:
             yield t
 
@@ -499,31 +499,36 @@ class Device(TypedModel, YamlValidatorMixin):
         self.merge_components(parent_components)
 
     def merge_components(self, components: Tree) -> None:
-        existing_components = list(walk(self.children))
+        children = list(self.children)
+        # Components compare equal by name, so index them by name once up front
+        existing_names = {c.name for c in walk(children)}
+        groups: dict[str, Group] = {}
+        for group in children:
+            if isinstance(group, Group):
+                groups.setdefault(group.name, group)
+
         for node in components:
             if isinstance(node, Group):
-                for group in self.children:
-                    if not isinstance(group, Group):
-                        continue
-                    elif group.name == node.name:
-                        group.children = list(group.children) + [
-                            c for c in node.children if c not in group.children
-                        ]
-                        break  # Groups merged - skip to next group
-
-                else:  # No break - Did not find the Group
+                group = groups.get(node.name)
+                if group is not None:
+                    group_names = {c.name for c in group.children}
+                    group.children = list(group.children) + [
+                        c for c in node.children if c.name not in group_names
+                    ]
+                else:  # Did not find the Group
                     # Remove any signals already in device from node
                     node.children = [
-                        c for c in node.children if c not in existing_components
+                        c for c in node.children if c.name not in existing_names
                     ]
 
                     # Add node as a new group
-                    self.children = list(self.children) + [node]
-
-                    continue  # Skip to next group
+                    children.append(node)
+                    groups[node.name] = node
             else:
                 # Node is an individual AsynParameter - just append it
-                self.children = list(self.children) + [node]
+                children.append(node)
+
+        self.children = children
 
     def generate_param_tree(self) -> str:
         param_tree = ", ".join(
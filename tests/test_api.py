@@ -1,11 +1,18 @@
+from dataclasses import fields
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
+import pvi._format.dls
+from pvi._convert.utils import insert_param_set_accessors
 from pvi._format.base import Formatter, IndexEntry
 from pvi._format.dls import DLSFormatter
+from pvi._format.edl import EdlTemplate
 from pvi._format.template import format_template
+from pvi._format.utils import Bounds, split_with_sep
+from pvi._format.widget import PVWidgetFormatter, WidgetFormatterFactory
+from pvi._pv_group import find_pvs
 from pvi.device import (
     LED,
     ButtonPanel,
@@ -291,3 +298,98 @@ def test_pvi_template(tmp_path, helper):
     format_template(device, "$(P)", output_template)
 
     helper.assert_output_matches(expected_bob, output_template)
+
+
+@pytest.mark.parametrize(
+    "source,parameters,expected",
+    [
+        # Adjacent uses are all replaced
+        ("    f(A,A);\n", ["A"], "    f(paramSet->A,paramSet->A);\n"),
+        # Names sharing a prefix are matched exactly, in either order
+        ("    x = AB + A;\n", ["A", "AB"], "    x = paramSet->AB + paramSet->A;\n"),
+        ("    x = AB + A;\n", ["AB", "A"], "    x = paramSet->AB + paramSet->A;\n"),
+        # A parameter listed twice is only prefixed once
+        ("    g(A);\n", ["A", "A"], "    g(paramSet->A);\n"),
+        ("    g(A);\n", [], "    g(A);\n"),
+    ],
+)
+def test_insert_param_set_accessors(source, parameters, expected):
+    assert insert_param_set_accessors(source, parameters) == expected
+
+
+@pytest.mark.parametrize(
+    "text,maxsplit,expected",
+    [
+        # A trailing sep leaves no empty remainder
+        ("a;b;", -1, ["a;", "b;"]),
+        # A non-empty remainder is kept without a sep
+        ("a;b;c", -1, ["a;", "b;", "c"]),
+        ("a;b;c", 1, ["a;", "b;c"]),
+        ("a;b;", 1, ["a;", "b;"]),
+        # sep not present
+        ("abc", -1, ["abc"]),
+        ("", 1, []),
+    ],
+)
+def test_split_with_sep(text, maxsplit, expected):
+    assert split_with_sep(text, ";", maxsplit) == expected
+
+
+def test_split_with_empty_sep():
+    with pytest.raises(ValueError, match="empty separator"):
+        split_with_sep("ab", "")
+
+
+def test_edl_set_literal_values():
+    template = EdlTemplate(
+        (Path(pvi._format.dls.__file__).parent / "dls.edl").read_text()
+    )
+    label = template.search('"Label"')
+
+    # Backslashes are inserted as-is, not parsed as regex replacement escapes, for
+    # both single line properties and `{ ... }` block properties
+    text = template.set(label, properties={"font": "a\\b", "value": "Gain A\\B"})
+
+    assert 'font "a\\b"\n' in text
+    assert 'value {\n  "Gain A\\B"\n}\n' in text
+
+
+def test_find_pvs(tmp_path: Path):
+    ui = tmp_path / "ui.adl"
+    ui.write_text(
+        "y=30 $(P)$(R)Gain\n"
+        "y=10 $(P)$(R)Gain_RBV\n"
+        "y=20 Acquire y=5\n"
+        "y=40 Acquire\n"
+        "y=1 $(P)$(R)Gain\n"
+    )
+
+    grouped, remaining = find_pvs(
+        ["$(P)$(R)Gain", "$(P)$(R)Gain_RBV", "Acquire", "Missing"], ui
+    )
+
+    # Ordered by the last y coordinate before the last occurrence of each PV, with
+    # regex metacharacters in the macros matched literally
+    assert grouped == ["$(P)$(R)Gain", "$(P)$(R)Gain_RBV", "Acquire"]
+    assert remaining == ["Missing"]
+
+
+@pytest.mark.parametrize("text", ["Acquire", "y=Acquire"])
+def test_find_pvs_without_y_coordinate(tmp_path: Path, text):
+    ui = tmp_path / "ui.adl"
+    ui.write_text(text)
+
+    with pytest.raises(AssertionError, match="did not match a y coordinate"):
+        find_pvs(["Acquire"], ui)
+
+
+def test_pv_widget_formatter_multiline_bounds():
+    factory = WidgetFormatterFactory(
+        **{f.name: PVWidgetFormatter for f in fields(WidgetFormatterFactory) if f.init}
+    )
+    bounds = Bounds(x=1, y=2, w=100, h=20)
+
+    formatter = factory.pv_widget_formatter(TextRead(lines=3), bounds, "PV")
+
+    assert formatter.bounds == Bounds(x=1, y=2, w=100, h=60)
+    assert bounds == Bounds(x=1, y=2, w=100, h=20)
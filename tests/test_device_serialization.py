@@ -6,6 +6,7 @@ from typing import Annotated, TypeAlias
 import pytest
 from pydantic import BaseModel, Discriminator, Field, Tag, ValidationError
 
+from pvi._yaml_utils import load_yaml
 from pvi.device import (
     LED,
     CheckBox,
@@ -19,6 +20,7 @@ from pvi.device import (
     TableWrite,
     TextRead,
     TextWrite,
+    walk,
 )
 from pvi.typed_model import TypedModel
 
@@ -73,6 +75,39 @@ def test_deserialize(device: Device):
     assert d == device
 
 
+def test_walk(device: Device):
+    assert [c.name for c in walk(device.children)] == [
+        "WidthUnits",
+        "Width",
+        "Table",
+        "OutA",
+    ]
+
+
+def test_load_yaml_cache(tmp_path: Path):
+    yaml = tmp_path / "cached.pvi.device.yaml"
+    yaml.write_text("label: Original\n")
+
+    # Modifying the returned dictionary must not modify the cached copy
+    load_yaml(yaml)["label"] = "Modified"
+    assert load_yaml(yaml) == {"label": "Original"}
+
+    # Modifying the file must invalidate the cached copy
+    yaml.write_text("label: Updated file\n")
+    assert load_yaml(yaml) == {"label": "Updated file"}
+
+    # Modifying the file without changing its size must also invalidate the cached copy
+    mtime_ns = yaml.stat().st_mtime_ns + 1_000_000_000
+    yaml.write_text("label: Changed file\n")
+    os.utime(yaml, ns=(mtime_ns, mtime_ns))
+    loaded = load_yaml(yaml)
+    assert loaded == {"label": "Changed file"}
+
+    # Modifying the returned dictionary must still not modify the new cached copy
+    loaded["label"] = "Modified"
+    assert load_yaml(yaml) == {"label": "Changed file"}
+
+
 def test_deserialize_raises():
     with pytest.raises(ValidationError):
         Device.deserialize(BAD_DEVICE_YAML)